@@ -1,24 +1,60 @@
-from sqlalchemy import create_engine, text, inspect
+from sqlalchemy import create_engine, text, inspect, select, func, cast, literal, literal_column, union_all, or_, String
+from sqlalchemy import table as sa_table, column as sa_column
+from sqlalchemy.exc import DBAPIError
 import pandas as pd
 import getpass
 import tkinter as tk
 from tkinter import filedialog
+import gzip
 import json
+import math
 import os
+import random
+import sqlite3
+import threading
+import time
 import yaml
 from docx import Document
 from docx.shared import Inches, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from datetime import datetime
+from decimal import Decimal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 ##USE THIS TO CONNECT TO REDSHIFT, POSTGRESQL, MYSQL, SQLITE, SQL SERVER AND EXPORT TABLES TO EXCEL, WORD, SWAGGER
 
+# Column profiling: columns with at most this many distinct values are documented as an enum
+PROFILE_ENUM_MAX_DISTINCT = 10
+# Number of most frequent values kept per column as examples
+PROFILE_TOP_VALUES = 5
+# Rows read for distinct counts and top values on dialects without a distinct-count sketch
+PROFILE_SAMPLE_ROWS = 100000
+# Column types that can't be compared or counted distinct on every dialect
+PROFILE_UNSUPPORTED_TYPES = ('json', 'blob', 'binary', 'bytea', 'image', 'xml', 'geometry',
+                             'geography', 'super', 'array', 'hstore', '[]')
+# Snapshot files hold everything collected from the database for offline re-rendering
+SNAPSHOT_FORMAT = 'swaggered-database-snapshot'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = '_snapshot.json.gz'
+# Ways the Word specification can be split into volumes
+WORD_VOLUME_PARTITIONS = ('schema', 'alpha', 'count')
+
 class DBToExcel:
     def __init__(self):
         self.engine = None
+        self.db_type = None
+        self.conn = None
+        self.session_tx = None
+        self.snapshot = False
+        self.snapshot_default_schema = None
     
     def load_allowed_tables(self, system_name):
-        """Load allowed tables from allowed_tables.json for specified system"""
+        """Load allowed tables from allowed_tables.json for specified system.
+        
+        Entries can be exact names, 'schema.table', globs ('stg_*', 'sales.*') or
+        regexes ('re:^fact_\\d+$', 'sales.re:^dim_'). An optional "schemas" list on
+        the system applies unqualified entries to each of those schemas.
+        """
         try:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             allowed_tables_file = os.path.join(current_dir, 'allowed_tables.json')
@@ -38,7 +74,13 @@ class DBToExcel:
                     print(f"Available systems: {', '.join(available_systems)}")
                 return None
             
-            return systems[system_name].get('allowed_tables', [])
+            system = systems[system_name]
+            allowed_tables = system.get('allowed_tables', [])
+            schemas = system.get('schemas')
+            if schemas:
+                allowed_tables = [entry if self._pattern_schema(entry) else f"{schema}.{entry}"
+                                  for entry in allowed_tables for schema in schemas]
+            return allowed_tables
             
         except Exception as e:
             print(f"Error loading allowed_tables.json: {e}")
@@ -70,31 +112,44 @@ class DBToExcel:
             return ['Sample Value 1', 'Sample Value 2', 'Sample Value 3']
     
     def connect(self, db_type, host, port, database, username, password=None):
-        if password is None:
+        db_type = db_type.lower()
+        if password is None and db_type != 'sqlite':
             password = getpass.getpass(f"Enter password for {username}: ")
         
-        # Ask user about SSL
-        use_ssl = input("Enable SSL connection? (y/n): ").lower().strip() == 'y'
+        # Ask user about SSL (not applicable to SQLite files)
+        use_ssl = False
+        if db_type != 'sqlite':
+            use_ssl = input("Enable SSL connection? (y/n): ").lower().strip() == 'y'
         ssl_mode = 'require' if use_ssl else 'disable'
         
+        # Ask user about running the whole pass in one consistent snapshot (not used for SQLite files)
+        use_snapshot = False
+        if db_type != 'sqlite':
+            use_snapshot = input("Run the whole export in one read-only snapshot transaction? (y/n): ").lower().strip() == 'y'
+        
+        sqlserver_encrypt = 'Encrypt=yes&TrustServerCertificate=yes' if use_ssl else 'Encrypt=no'
         connection_strings = {
             'redshift': f'redshift+psycopg2://{username}:{password}@{host}:{port}/{database}',
             'postgresql': f'postgresql+psycopg2://{username}:{password}@{host}:{port}/{database}',
             'mysql': f'mysql+pymysql://{username}:{password}@{host}:{port}/{database}',
             'sqlite': f'sqlite:///{database}',
-            'sqlserver': f'mssql+pyodbc://{username}:{password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server'
+            'sqlserver': f'mssql+pyodbc://{username}:{password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server&{sqlserver_encrypt}'
         }
         
         try:
-            conn_str = connection_strings[db_type.lower()]
+            conn_str = connection_strings[db_type]
             
-            self.engine = create_engine(conn_str, connect_args={'sslmode': ssl_mode})
-            with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            self.db_type = db_type
+            self.engine = create_engine(conn_str, connect_args=self._connect_args(db_type, use_ssl),
+                                        **self._engine_options(db_type))
+            # Keep the first connection open and reuse it for inspection and sampling
+            self.open_session(snapshot=use_snapshot)
+            self.conn.execute(text("SELECT 1"))
             print(f"Connected to {db_type} with SSL mode: {ssl_mode}")
             #self.export_tables_to_excel()
             return True
         except Exception as e:
+            self.close_session()
             error_msg = str(e)
             if "no pg_hba.conf entry" in error_msg:
                 print(f"Connection failed: Your IP address is not authorized to connect to this database.")
@@ -104,6 +159,174 @@ class DBToExcel:
                 print(f"Connection failed: {e}")
             return False
     
+    def _connect_args(self, db_type, use_ssl):
+        """Build DBAPI connect arguments that the driver for db_type actually accepts"""
+        if db_type in ('redshift', 'postgresql'):
+            return {'sslmode': 'require' if use_ssl else 'disable', 'connect_timeout': 30}
+        if db_type == 'mysql':
+            connect_args = {'connect_timeout': 30}
+            if use_ssl:
+                # A non-empty ssl dict turns on TLS in pymysql; no CA given, like sslmode=require
+                connect_args['ssl'] = {'check_hostname': False}
+            return connect_args
+        if db_type == 'sqlserver':
+            # Encryption is set in the ODBC connection string; timeout is the login timeout
+            return {'timeout': 30}
+        return {}
+    
+    def _engine_options(self, db_type):
+        """Small pool of warm connections, checked before use and recycled before server timeouts"""
+        if db_type == 'sqlite':
+            # File databases use SQLAlchemy's default pool for SQLite
+            return {}
+        return {
+            'pool_size': 2,
+            'max_overflow': 2,
+            'pool_pre_ping': True,
+            'pool_recycle': 1800
+        }
+    
+    def open_session(self, snapshot=False):
+        """Open the long-lived connection used for the whole run.
+        
+        With snapshot=True the connection runs one read-only transaction at the
+        strongest consistent-read level the dialect offers, so every table is
+        documented from the same point in time. Otherwise it runs in autocommit.
+        """
+        self.close_session()
+        
+        if snapshot and self.db_type == 'sqlite':
+            print("Snapshot transactions are not used for SQLite files, continuing without one")
+            snapshot = False
+        if snapshot and self.db_type == 'sqlserver' and not self._sqlserver_snapshot_allowed():
+            print("Snapshot isolation is not enabled on this database, continuing without a snapshot")
+            snapshot = False
+        
+        conn = self.engine.connect()
+        if snapshot:
+            isolation_levels = {
+                'postgresql': 'REPEATABLE READ',
+                'redshift': 'SERIALIZABLE',
+                'mysql': 'REPEATABLE READ',
+                'sqlserver': 'SNAPSHOT'
+            }
+            options = {'isolation_level': isolation_levels[self.db_type]}
+            if self.db_type in ('postgresql', 'redshift'):
+                options['postgresql_readonly'] = True
+            conn = conn.execution_options(**options)
+            self.conn = conn
+            self.session_tx = self._begin_snapshot()
+            print(f"Running in a read-only {isolation_levels[self.db_type]} snapshot transaction")
+        else:
+            self.conn = conn.execution_options(isolation_level='AUTOCOMMIT')
+            self.session_tx = None
+        self.snapshot = snapshot
+        self._configure_non_blocking_reads(snapshot)
+        return self.conn
+    
+    def _sqlserver_snapshot_allowed(self):
+        # Probe on a pooled connection; isolation can't change once a transaction has started
+        with self.engine.connect() as probe:
+            state = probe.execute(text(
+                "SELECT snapshot_isolation_state FROM sys.databases WHERE name = DB_NAME()")).scalar()
+        return state == 1
+    
+    def _configure_non_blocking_reads(self, snapshot):
+        """Keep documentation reads from blocking, or being blocked by, application traffic.
+        
+        Lock timeouts make a read fail fast instead of queueing behind DDL or writers.
+        Outside a snapshot the session reads at the lowest isolation level that is
+        still safe for sampling.
+        """
+        statements = []
+        if self.db_type == 'postgresql':
+            # MVCC reads never wait on writers, only on DDL locks
+            statements.append("SET lock_timeout = '5s'")
+        elif self.db_type == 'mysql':
+            statements.append("SET SESSION lock_wait_timeout = 5")
+            if not snapshot:
+                # InnoDB consistent non-locking reads with a fresh read view per statement
+                statements.append("SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED")
+        elif self.db_type == 'sqlserver':
+            statements.append("SET LOCK_TIMEOUT 5000")
+            if not snapshot:
+                # Row versioning when the database allows it, otherwise read without shared locks
+                level = 'SNAPSHOT' if self._sqlserver_snapshot_allowed() else 'READ UNCOMMITTED'
+                statements.append(f"SET TRANSACTION ISOLATION LEVEL {level}")
+        
+        for statement in statements:
+            self.conn.execute(text(statement))
+    
+    def _begin_snapshot(self):
+        tx = self.conn.begin()
+        if self.db_type == 'mysql':
+            self.conn.execute(text("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY"))
+        return tx
+    
+    def close_session(self):
+        """End the snapshot transaction (if any) and return the session connection to the pool"""
+        conn = getattr(self, 'conn', None)
+        if conn is None:
+            return
+        try:
+            tx = getattr(self, 'session_tx', None)
+            if tx is not None and tx.is_active:
+                # Nothing was written, so commit just ends the read-only transaction
+                tx.commit()
+        finally:
+            conn.close()
+            self.conn = None
+            self.session_tx = None
+    
+    def _fetch_session_rows(self, statement):
+        """Run a query on the session connection and fetch all rows.
+        
+        Inside a snapshot each query runs under a savepoint so one failing table
+        doesn't abort the whole transaction. Redshift has no savepoints, so there a
+        failure restarts the snapshot.
+        """
+        return self._with_session_retry(lambda: self._fetch_rows_once(statement))
+    
+    def _fetch_rows_once(self, statement):
+        if not self.snapshot:
+            return self.conn.execute(statement).fetchall()
+        if self.db_type != 'redshift':
+            with self.conn.begin_nested():
+                return self.conn.execute(statement).fetchall()
+        try:
+            return self.conn.execute(statement).fetchall()
+        except DBAPIError as e:
+            if e.connection_invalidated:
+                raise
+            print("  LOG: Query failed inside the snapshot, starting a new snapshot transaction")
+            self.session_tx.rollback()
+            self.session_tx = self._begin_snapshot()
+            raise
+    
+    def _with_session_retry(self, operation):
+        """Run operation(); if the server dropped the session connection, reopen it and retry once.
+        
+        The session connection is held for the whole run, so pool pre-ping and
+        recycle never see it again after checkout.
+        """
+        try:
+            return operation()
+        except DBAPIError as e:
+            if not e.connection_invalidated:
+                raise
+            snapshot = self.snapshot
+            print("  LOG: Lost the database connection, reconnecting")
+            if snapshot:
+                print("  LOG: Remaining tables will be read from a new snapshot")
+            try:
+                self.close_session()
+            except Exception:
+                # The old connection is already gone; just drop it
+                self.conn = None
+                self.session_tx = None
+            self.open_session(snapshot=snapshot)
+            return operation()
+    
     def export_tables_to_excel(self, output_file=None):
         if output_file is None:
             root = tk.Tk()
@@ -116,8 +339,9 @@ class DBToExcel:
             if not output_file:
                 print("Export cancelled")
                 return
-        inspector = inspect(self.engine)
-        tables = inspector.get_table_names(schema='public')
+        inspector = inspect(self.conn)
+        default_schema = self._default_schema()
+        tables = None
         
         # Ask if this is test mode or subset
         test_mode = input("\nIs this test mode or subset? (y/n): ").lower().strip()
@@ -128,49 +352,51 @@ class DBToExcel:
                 system_name = input("Enter system name from allowed_tables.json: ").strip()
                 requested_tables = self.load_allowed_tables(system_name)
                 if requested_tables:
-                    requested_tables.sort()  # Sort alphabetically
-                    # Log tables that don't exist
-                    for req_table in requested_tables:
-                        if req_table not in tables:
-                            print(f"LOG: Table '{req_table}' does not exist in database")
-                    tables = [t for t in requested_tables if t in tables]  # Maintain sorted order
+                    # Logs tables that don't exist, result is sorted alphabetically
+                    tables = self.select_tables(requested_tables)
                     print(f"Test mode or subset: Processing {len(tables)} tables from system '{system_name}'")
                 else:
                     print(f"No tables found for system '{system_name}', using first 20 tables")
-                    tables = tables[:20]
+                    tables = inspector.get_table_names(schema=default_schema)[:20]
             else:
-                specific_tables = input("Specify table names (comma-separated) or press Enter for first 20 tables: ").strip()
+                specific_tables = input("Specify table names or patterns (comma-separated; regexes with commas such as "
+                                        "re:^a{1,3} must go in allowed_tables.json) or press Enter for first 20 tables: ").strip()
                 if specific_tables:
-                    requested_tables = [t.strip() for t in specific_tables.split(',')]
-                    # Log tables that don't exist
-                    for req_table in requested_tables:
-                        if req_table not in tables:
-                            print(f"LOG: Table '{req_table}' does not exist in database")
-                    tables = [t for t in tables if t in requested_tables]
+                    requested_tables = [t.strip() for t in specific_tables.split(',') if t.strip()]
+                    tables = self.select_tables(requested_tables)
                     print(f"Test mode or subset: Processing {len(tables)} specified tables")
                 else:
-                    tables = tables[:20]
+                    tables = inspector.get_table_names(schema=default_schema)[:20]
                     print(f"Test mode or subset: Processing first {len(tables)} tables only")
         
+        if tables is None:
+            tables = inspector.get_table_names(schema=default_schema)
+        
+        # Ask if columns should be profiled for richer Swagger constraints
+        self.profile_columns = input("\nProfile columns (null fraction, min/max, distinct count, top values)? (y/n): ").lower().strip() == 'y'
+        
         all_data = []
         
         for table in tables:
             print(f"Processing table: {table}")
-            columns = inspector.get_columns(table, schema='public')
+            schema, table_name = self._split_table_name(table)
+            # A fresh inspector follows the session connection if it had to be reopened
+            columns = self._with_session_retry(
+                lambda: inspect(self.conn).get_columns(table_name, schema=schema))
             
             # Get sample data
             sample_df = pd.DataFrame()
             table_is_empty = False
             try:
-                with self.engine.connect() as conn:
-                    result = conn.execute(text(f"SELECT * FROM public.{table} LIMIT 2"))
-                    rows = result.fetchall()
-                    if rows:
-                        sample_df = pd.DataFrame(rows, columns=[col['name'] for col in columns])
-                    else:
-                        table_is_empty = True
-                        if test_mode == 'y':
-                            print(f"  LOG: Table {table} is empty (test mode or subset)")
+                # Compiled per dialect: LIMIT, TOP or FETCH FIRST, with quoted identifiers
+                table_ref = self._table_ref(table_name, columns, schema)
+                rows = self._fetch_session_rows(select(*table_ref.c).limit(2))
+                if rows:
+                    sample_df = pd.DataFrame(rows, columns=[col['name'] for col in columns])
+                else:
+                    table_is_empty = True
+                    if test_mode == 'y':
+                        print(f"  LOG: Table {table} is empty (test mode or subset)")
                 
                 print(f"  Got {len(sample_df)} sample rows")
                 
@@ -194,6 +420,15 @@ class DBToExcel:
             except Exception as e:
                 print(f"  Error getting sample data: {e}")
             
+            # Profile columns with one aggregate query per table
+            profile = {}
+            if self.profile_columns and not table_is_empty:
+                try:
+                    profile = self.profile_table(table_name, columns, schema=schema)
+                    print(f"  Profiled {len(profile)} columns")
+                except Exception as e:
+                    print(f"  Error profiling columns: {e}")
+            
             # Add to documentation - include empty tables with sample data for Swagger
             for col in columns:
                 sample_values = ['', '', '']
@@ -205,7 +440,7 @@ class DBToExcel:
                     # Generate sample data based on column type for empty tables
                     sample_values = self.generate_sample_data(col)
                 
-                all_data.append({
+                row = {
                     'Table': table,
                     'Column': col['name'],
                     'Data_Type': str(col['type']),
@@ -214,7 +449,21 @@ class DBToExcel:
                     'Sample_1': sample_values[0],
                     'Sample_2': sample_values[1],
                     'Sample_3': sample_values[2]
-                })
+                }
+                if self.profile_columns:
+                    col_profile = profile.get(col['name'], {})
+                    row.update({
+                        'Null_Fraction': col_profile.get('null_fraction', ''),
+                        'Min_Value': col_profile.get('min', ''),
+                        'Max_Value': col_profile.get('max', ''),
+                        'Distinct_Count': col_profile.get('distinct', ''),
+                        'Top_Values': json.dumps(col_profile['top_values']) if col_profile.get('top_values') else '',
+                        'Profile_Scope': col_profile.get('scope', '')
+                    })
+                all_data.append(row)
+        
+        # Data collection is done; end the snapshot before writing and rendering documents
+        self.close_session()
         
         df = pd.DataFrame(all_data)
         df.to_excel(output_file, index=False)
@@ -223,12 +472,36 @@ class DBToExcel:
         # Store test_mode for use in other methods
         self.test_mode = test_mode == 'y'
         
+        # Save everything collected so documentation can be re-rendered without the database
+        try:
+            self.save_snapshot(tables, all_data, output_file)
+        except Exception as e:
+            print(f"Warning: Could not save schema snapshot: {e}")
+        
+        self._render_documents(tables, all_data, output_file)
+    
+    def _render_documents(self, tables, all_data, output_file, samples=None):
+        """Ask which documents to create from the collected schema and render them.
+        
+        samples maps table -> {'json': records, 'xml': text}; None reads the sample
+        files next to output_file.
+        """
         # Ask user if they want to create Word document
         create_word = input("\nWould you like to create a Word specification document? (y/n): ").lower().strip()
         include_xml = False
         if create_word == 'y':
             include_xml = input("Include XML samples in documentation? (y/n): ").lower().strip() == 'y'
-            self.create_word_spec(tables, all_data, output_file, include_xml)
+            split_volumes = input("Split Word document into volumes rendered in parallel? (y/n): ").lower().strip() == 'y'
+            if split_volumes:
+                partition_by = input("Partition volumes by schema, alpha or count (press Enter for count): ").lower().strip() or 'count'
+                while partition_by not in WORD_VOLUME_PARTITIONS:
+                    partition_by = input("Enter schema, alpha or count (press Enter for count): ").lower().strip() or 'count'
+                max_tables = input("Max tables per volume (press Enter for 250): ").strip()
+                max_tables = int(max_tables) if max_tables.isdigit() else 250
+                self.create_word_spec_volumes(tables, all_data, output_file, include_xml, partition_by, max_tables,
+                                              samples=samples)
+            else:
+                self.create_word_spec(tables, all_data, output_file, include_xml, samples=samples)
         
         # Ask user if they want to create Swagger documentation
         create_swagger = input("\nWould you like to create Swagger/OpenAPI documentation? (y/n): ").lower().strip()
@@ -237,208 +510,807 @@ class DBToExcel:
                 include_xml = input("Include XML support in Swagger? (y/n): ").lower().strip() == 'y'
             self.create_swagger_spec(tables, all_data, output_file, include_xml)
     
-    def create_word_spec(self, tables, all_data, excel_file, include_xml=False):
+    def _default_schema(self):
+        """Schema that unqualified table names refer to"""
+        if self.db_type in (None, 'postgresql', 'redshift'):
+            return 'public'
+        if self.engine is None:
+            # Rendering from a snapshot: use the schema recorded when it was taken
+            return self.snapshot_default_schema or {'sqlserver': 'dbo', 'sqlite': 'main'}.get(self.db_type, 'public')
+        return self.engine.dialect.default_schema_name
+    
+    def _split_table_name(self, table):
+        """Split a table identifier into (schema, name); bare names are in the default schema"""
+        if '.' in table:
+            schema, name = table.split('.', 1)
+            return schema, name
+        return self._default_schema(), table
+    
+    def _table_identifier(self, schema, name):
+        return name if schema == self._default_schema() else f"{schema}.{name}"
+    
+    def _pattern_schema(self, entry):
+        """Schema part of a table entry, or None when it is unqualified"""
+        if 're:' in entry:
+            schema = entry[:entry.index('re:')].rstrip('.')
+            return schema or None
+        return entry.split('.', 1)[0] if '.' in entry else None
+    
+    def _parse_table_pattern(self, entry):
+        """Parse a table entry into (schema, kind, value) with kind 'exact', 'glob' or 'regex'.
+        
+        Returns None, after logging it, for an entry whose regex does not compile.
+        """
+        import re
+        schema = self._pattern_schema(entry) or self._default_schema()
+        if 're:' in entry:
+            value = entry[entry.index('re:') + 3:]
+            try:
+                re.compile(value)
+            except re.error as e:
+                print(f"LOG: Pattern '{entry}' is not a valid regex ({e}), skipping")
+                return None
+            return schema, 'regex', value
+        name = entry.split('.', 1)[1] if '.' in entry else entry
+        if any(ch in name for ch in '*?['):
+            return schema, 'glob', name
+        return schema, 'exact', name
+    
+    def _pattern_like_prefix(self, kind, value):
+        """LIKE pattern that pre-filters a glob or regex in the catalog query, or None for no filter"""
+        import re
+        if kind == 'glob':
+            like = value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+            like = like.replace('*', '%').replace('?', '_')
+            if '[' in like:
+                # Character classes have no LIKE equivalent; keep the literal prefix
+                like = like[:like.index('[')] + '%'
+            return like
+        # Only a plain '^literal' start is trusted; any alternation could match other names
+        if '|' in value:
+            return None
+        match = re.match(r'\^([A-Za-z0-9_]+)', value)
+        if not match:
+            return None
+        prefix = match.group(1)
+        # A quantifier after the last literal character makes it optional
+        following = value[match.end():match.end() + 1]
+        if following in ('*', '?', '{'):
+            prefix = prefix[:-1]
+        if not prefix:
+            return None
+        return prefix.replace('_', '\\_') + '%'
+    
+    def select_tables(self, requested):
+        """Resolve requested table names and patterns to existing tables.
+        
+        The selection is pushed down into one filtered catalog query; exact names are
+        then checked with set lookups. Missing tables and empty patterns are logged.
+        Returns sorted identifiers, with tables outside the default schema as 'schema.table'.
+        """
+        import re
+        from fnmatch import fnmatchcase
+        
+        exact = set()
+        patterns = []
+        for entry in requested:
+            parsed = self._parse_table_pattern(entry)
+            if parsed is None:
+                continue
+            schema, kind, value = parsed
+            if kind == 'exact':
+                exact.add((schema, value))
+            else:
+                patterns.append((entry, schema, kind, value))
+        
+        schemas = {schema for schema, _ in exact} | {schema for _, schema, _, _ in patterns}
+        like_filters = set()
+        unfiltered = False
+        for _, _, kind, value in patterns:
+            like = self._pattern_like_prefix(kind, value)
+            if like is None:
+                unfiltered = True
+            else:
+                like_filters.add(like)
+        
+        try:
+            found = self._query_catalog(schemas, {name for _, name in exact},
+                                        None if unfiltered else like_filters)
+        except Exception as e:
+            print(f"LOG: Catalog query failed ({e}), listing tables per schema instead")
+            found = self._list_schema_tables(schemas)
+        
+        selected = exact & found
+        for schema, name in sorted(exact - found):
+            print(f"LOG: Table '{self._table_identifier(schema, name)}' does not exist in database")
+        
+        for entry, schema, kind, value in patterns:
+            regex = re.compile(value) if kind == 'regex' else None
+            matches = {(s, name) for s, name in found
+                       if s == schema and (regex.search(name) if regex else fnmatchcase(name, value))}
+            if not matches:
+                print(f"LOG: Pattern '{entry}' matched no tables")
+            selected |= matches
+        
+        return sorted(self._table_identifier(schema, name) for schema, name in selected)
+    
+    def _list_schema_tables(self, schemas):
+        """Return {(schema, table)} for every table in schemas, skipping schemas that don't exist"""
+        inspector = inspect(self.conn)
+        found = set()
+        for schema in sorted(schemas):
+            try:
+                found.update((schema, name) for name in inspector.get_table_names(schema=schema))
+            except Exception as e:
+                print(f"LOG: Could not list tables in schema '{schema}': {e}")
+        return found
+    
+    def _query_catalog(self, schemas, exact_names, like_filters):
+        """Return {(schema, table)} for base tables in schemas matching the names or LIKE filters.
+        
+        like_filters=None means no name filter beyond the schemas.
+        """
+        if self.db_type == 'sqlite':
+            # SQLite has no information_schema; its catalog is small and local
+            return self._list_schema_tables(schemas)
+        
+        catalog = sa_table('tables', sa_column('table_schema'), sa_column('table_name'),
+                           sa_column('table_type'), schema='information_schema')
+        statement = select(catalog.c.table_schema, catalog.c.table_name).where(
+            catalog.c.table_type == 'BASE TABLE',
+            catalog.c.table_schema.in_(sorted(schemas))
+        )
+        if like_filters is not None:
+            name_filters = []
+            if exact_names:
+                name_filters.append(catalog.c.table_name.in_(sorted(exact_names)))
+            name_filters.extend(catalog.c.table_name.like(like, escape='\\') for like in sorted(like_filters))
+            statement = statement.where(or_(*name_filters))
+        return {(row[0], row[1]) for row in self._fetch_session_rows(statement)}
+    
+    def save_snapshot(self, tables, all_data, output_file):
+        """Save the collected schema, profile and samples to a compressed snapshot file.
+        
+        Columns are stored column-oriented and the file is gzipped JSON, so even
+        thousands of tables load in well under a second.
+        """
+        base_path = os.path.dirname(output_file)
+        snapshot_file = output_file.replace('.xlsx', SNAPSHOT_SUFFIX)
+        
+        fields = []
+        for row in all_data:
+            for key in row:
+                if key not in fields:
+                    fields.append(key)
+        columns = {field: [row.get(field, '') for row in all_data] for field in fields}
+        
+        samples = self._load_sample_files(tables, base_path)
+        
+        snapshot = {
+            'format': SNAPSHOT_FORMAT,
+            'version': SNAPSHOT_VERSION,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'db_type': self.db_type,
+            'default_schema': self._default_schema(),
+            'test_mode': getattr(self, 'test_mode', False),
+            'tables': list(tables),
+            'columns': columns,
+            'samples': samples
+        }
+        with gzip.open(snapshot_file, 'wt', encoding='utf-8', compresslevel=6) as f:
+            json.dump(snapshot, f, separators=(',', ':'), default=str)
+        print(f"Schema snapshot saved to: {snapshot_file}")
+        return snapshot_file
+    
+    def load_snapshot(self, snapshot_file):
+        """Load a snapshot file, returning (tables, all_data, samples) or None if it can't be used"""
+        try:
+            with gzip.open(snapshot_file, 'rt', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            print(f"Error loading snapshot {snapshot_file}: {e}")
+            return None
+        
+        if snapshot.get('format') != SNAPSHOT_FORMAT:
+            print(f"{snapshot_file} is not a schema snapshot file")
+            return None
+        if snapshot.get('version', 0) > SNAPSHOT_VERSION:
+            print(f"Snapshot version {snapshot['version']} is newer than supported version {SNAPSHOT_VERSION}")
+            return None
+        
+        columns = snapshot['columns']
+        fields = list(columns)
+        row_count = len(columns[fields[0]]) if fields else 0
+        all_data = [{field: columns[field][i] for field in fields} for i in range(row_count)]
+        
+        self.db_type = snapshot.get('db_type')
+        self.snapshot_default_schema = snapshot.get('default_schema')
+        self.test_mode = snapshot.get('test_mode', False)
+        print(f"Loaded snapshot from {snapshot['created']}: {len(snapshot['tables'])} tables, {row_count} columns")
+        return snapshot['tables'], all_data, snapshot.get('samples', {})
+    
+    def render_from_snapshot(self, snapshot_file=None, output_file=None):
+        """Re-render Excel, Word and Swagger output from a snapshot with no database connection"""
+        if snapshot_file is None:
+            root = tk.Tk()
+            root.withdraw()
+            snapshot_file = filedialog.askopenfilename(
+                filetypes=[("Schema snapshot", f"*{SNAPSHOT_SUFFIX}"), ("All files", "*.*")],
+                title="Select schema snapshot"
+            )
+            if not snapshot_file:
+                print("Render cancelled")
+                return
+        
+        loaded = self.load_snapshot(snapshot_file)
+        if loaded is None:
+            return
+        tables, all_data, samples = loaded
+        
+        if output_file is None:
+            if not snapshot_file.endswith(SNAPSHOT_SUFFIX):
+                print(f"Snapshot file name must end in {SNAPSHOT_SUFFIX} to derive the output file name")
+                return
+            output_file = snapshot_file[:-len(SNAPSHOT_SUFFIX)] + '.xlsx'
+        if not output_file.endswith('.xlsx'):
+            print("Output file must be an .xlsx file")
+            return
+        base_path = os.path.dirname(output_file)
+        
+        # Write the snapshot's samples as output files, replacing any older ones on disk
+        for table, table_samples in samples.items():
+            with open(os.path.join(base_path, f"{table}_sample.json"), 'w') as f:
+                json.dump(table_samples['json'], f, indent=2)
+            if 'xml' in table_samples:
+                with open(os.path.join(base_path, f"{table}_sample.xml"), 'w') as f:
+                    f.write(table_samples['xml'])
+        print(f"Wrote sample files for {len(samples)} tables to {base_path}")
+        
+        write_excel = input("\nWrite Excel file from snapshot? (y/n): ").lower().strip() == 'y'
+        if write_excel:
+            pd.DataFrame(all_data).to_excel(output_file, index=False)
+            print(f"Exported {len(tables)} tables with {len(all_data)} columns to: {output_file}")
+        
+        # Writers use the snapshot's samples directly, never whatever else is on disk
+        self._render_documents(tables, all_data, output_file, samples=samples)
+    
+    def _table_ref(self, table, columns, schema):
+        """Lightweight table construct so SQLAlchemy quotes names and compiles dialect-specific SQL"""
+        return sa_table(table, *[sa_column(col['name']) for col in columns], schema=schema)
+    
+    def profile_table(self, table, columns, schema='public'):
+        """Profile every column of a table.
+        
+        Returns {column: {'null_fraction', 'min', 'max', 'distinct', 'top_values', 'scope'}}.
+        Null fraction and MIN/MAX always come from one aggregate query over the whole
+        table. Distinct counts come from the same query where the dialect has a
+        sketch, from pg_stats on PostgreSQL, and otherwise from the first
+        PROFILE_SAMPLE_ROWS rows. Top values are only collected for low-cardinality
+        columns, with one UNION ALL query rather than one query per column. scope is
+        'full' when distinct count and top values cover the whole table and
+        'estimated' when they don't.
+        """
+        table_ref = self._table_ref(table, columns, schema)
+        sketch = self._has_distinct_sketch()
+        
+        aggregates = [func.count().label('row_count')]
+        plans = {}
+        for i, col in enumerate(columns):
+            ordered, countable = self._profile_kind(col['type'])
+            column_ref = table_ref.c[col['name']]
+            aggregates.append(func.count(column_ref).label(f'c{i}_n'))
+            if ordered:
+                aggregates.append(func.min(column_ref).label(f'c{i}_min'))
+                aggregates.append(func.max(column_ref).label(f'c{i}_max'))
+            if countable and sketch:
+                aggregates.append(self._approx_count_distinct(col['name']).label(f'c{i}_d'))
+            plans[col['name']] = (i, ordered, countable)
+        
+        rows = self._fetch_session_rows(select(*aggregates).select_from(table_ref))
+        stats = rows[0]._mapping
+        row_count = stats['row_count'] or 0
+        countable_names = [name for name, (_, _, countable) in plans.items() if countable]
+        
+        # Distinct counts (and on PostgreSQL the most common values) for countable columns
+        top_values = {}
+        if sketch:
+            distinct_counts = {name: stats[f'c{plans[name][0]}_d'] for name in countable_names}
+            value_source = table_ref
+        else:
+            distinct_counts = {}
+            if self.db_type == 'postgresql' and countable_names:
+                distinct_counts, top_values = self._pg_stats_profile(table, schema, countable_names, row_count)
+            value_source = select(*table_ref.c).limit(PROFILE_SAMPLE_ROWS).subquery('profiled_rows')
+            if countable_names and not distinct_counts:
+                distinct_counts = self._bounded_distinct_counts(value_source, countable_names)
+        scope = 'full' if sketch else 'estimated'
+        
+        profile = {}
+        enum_candidates = []
+        for col_name, (i, ordered, countable) in plans.items():
+            non_null = stats[f'c{i}_n'] or 0
+            col_profile = {
+                'null_fraction': round((row_count - non_null) / row_count, 4) if row_count else 0.0
+            }
+            if ordered:
+                for key in ('min', 'max'):
+                    value = stats[f'c{i}_{key}']
+                    col_profile[key] = '' if value is None else str(value)
+            if countable and distinct_counts.get(col_name) is not None:
+                distinct = int(distinct_counts[col_name])
+                col_profile['distinct'] = distinct
+                col_profile['scope'] = scope
+                # Only repeated values make an enum; a few unique keys in a tiny table don't
+                if 0 < distinct <= PROFILE_ENUM_MAX_DISTINCT and non_null > distinct:
+                    enum_candidates.append(col_name)
+            profile[col_name] = col_profile
+        
+        missing_values = [name for name in enum_candidates if name not in top_values]
+        if missing_values:
+            top_values.update(self._top_values(value_source, missing_values))
+        for col_name in enum_candidates:
+            if top_values.get(col_name):
+                profile[col_name]['top_values'] = top_values[col_name]
+        
+        return profile
+    
+    def _pg_stats_profile(self, table, schema, col_names, row_count):
+        """Distinct estimates and most common values from PostgreSQL's planner statistics.
+        
+        Reading pg_stats costs nothing; it is empty for tables that were never analyzed.
+        Returns ({column: distinct}, {column: [values]}).
+        """
+        statement = text(
+            "SELECT s.attname, s.inherited, s.n_distinct, v.value "
+            "FROM pg_stats s "
+            "LEFT JOIN LATERAL unnest(s.most_common_vals::text::text[]) WITH ORDINALITY AS v(value, ord) ON true "
+            "WHERE s.schemaname = :schema AND s.tablename = :table "
+            "ORDER BY s.attname, s.inherited DESC, v.ord"
+        ).bindparams(schema=schema, table=table)
+        try:
+            rows = self._fetch_session_rows(statement)
+        except DBAPIError as e:
+            print(f"  LOG: Could not read pg_stats for {table}: {e}")
+            return {}, {}
+        
+        wanted = set(col_names)
+        distinct_counts, top_values = {}, {}
+        used_inherited = {}
+        for attname, inherited, n_distinct, value in rows:
+            if attname not in wanted:
+                continue
+            # Parents of partitions/inheritance have a row covering the whole hierarchy; prefer it
+            if used_inherited.setdefault(attname, inherited) != inherited:
+                continue
+            # Negative n_distinct is a fraction of the row count
+            distinct_counts[attname] = n_distinct if n_distinct >= 0 else -n_distinct * row_count
+            if value is not None:
+                top_values.setdefault(attname, []).append(value)
+        return distinct_counts, top_values
+    
+    def _bounded_distinct_counts(self, value_source, col_names):
+        """Exact COUNT(DISTINCT) over the bounded-row subquery; an estimate for the whole table"""
+        counts = [self._approx_count_distinct(name).label(f'd{i}') for i, name in enumerate(col_names)]
+        row = self._fetch_session_rows(select(*counts).select_from(value_source))[0]
+        return {name: row[i] for i, name in enumerate(col_names)}
+    
+    def _top_values(self, value_source, col_names):
+        """Values of low-cardinality columns, most frequent first, with one UNION ALL query"""
+        parts = []
+        for col_name in col_names:
+            column_ref = value_source.c[col_name]
+            parts.append(
+                select(literal(col_name).label('column_name'),
+                       cast(column_ref, String(255)).label('value'),
+                       func.count().label('frequency'))
+                .select_from(value_source)
+                .where(column_ref.isnot(None))
+                .group_by(column_ref)
+            )
+        values = {}
+        for row in self._fetch_session_rows(union_all(*parts)):
+            values.setdefault(row.column_name, []).append((row.frequency, row.value))
+        top_values = {}
+        for col_name, counted in values.items():
+            counted.sort(key=lambda item: (-item[0], str(item[1])))
+            top_values[col_name] = [value for _, value in counted]
+        return top_values
+    
+    def _profile_kind(self, col_type):
+        """Return (ordered, countable): whether MIN/MAX and COUNT(DISTINCT) apply to a column type"""
+        col_type_lower = str(col_type).lower()
+        if any(t in col_type_lower for t in PROFILE_UNSUPPORTED_TYPES):
+            return False, False
+        if self.db_type == 'sqlserver' and ('text' in col_type_lower or 'bit' in col_type_lower):
+            # TEXT/NTEXT can't be compared at all, BIT can be counted but has no MIN/MAX
+            return False, 'bit' in col_type_lower
+        openapi_type = self._map_db_type_to_openapi(col_type_lower)
+        ordered = openapi_type['type'] in ('integer', 'number') or \
+            openapi_type.get('format') in ('date', 'date-time', 'time')
+        return ordered, True
+    
+    def _has_distinct_sketch(self):
+        """Whether the dialect has an approximate COUNT(DISTINCT) that stays cheap on a whole table"""
+        if self.db_type == 'redshift':
+            return True
+        server_version = getattr(self.engine.dialect, 'server_version_info', None) or (0,)
+        # APPROX_COUNT_DISTINCT is available from SQL Server 2019
+        return self.db_type == 'sqlserver' and server_version[0] >= 15
+    
+    def _approx_count_distinct(self, col_name):
+        """Distinct count using the dialect's sketch where one exists"""
+        quoted = self.engine.dialect.identifier_preparer.quote(col_name)
+        if self.db_type == 'redshift':
+            return literal_column(f"APPROXIMATE COUNT(DISTINCT {quoted})")
+        if self.db_type == 'sqlserver' and self._has_distinct_sketch():
+            return literal_column(f"APPROX_COUNT_DISTINCT({quoted})")
+        # Not a sketch: an exact count, only affordable over the bounded rows of _bounded_distinct_counts
+        return literal_column(f"COUNT(DISTINCT {quoted})")
+    
+    def create_word_spec(self, tables, all_data, excel_file, include_xml=False, samples=None):
+        if samples is None:
+            samples = self._load_sample_files(tables, os.path.dirname(excel_file))
+        # Only tables with sample data are documented
+        tables_with_data = [table for table in tables if table in samples]
+        
+        doc = self._build_word_document(tables_with_data, all_data, samples, include_xml,
+                                        getattr(self, 'test_mode', False))
+        
+        # Save Word document
+        word_file = excel_file.replace('.xlsx', '_specification.docx')
+        doc.save(word_file)
+        print(f"Word specification saved to: {word_file}")
+    
+    def create_word_spec_volumes(self, tables, all_data, excel_file, include_xml=False,
+                                 partition_by='count', max_tables_per_volume=250, max_workers=None,
+                                 samples=None):
+        """Render the Word specification as several volume documents plus a master index.
+        
+        Volumes are rendered in separate worker processes so total render time scales
+        with the number of cores. partition_by is 'schema', 'alpha' or 'count'.
+        """
+        if partition_by not in WORD_VOLUME_PARTITIONS:
+            print(f"Unknown volume partitioning '{partition_by}', expected one of: {', '.join(WORD_VOLUME_PARTITIONS)}")
+            return []
+        if samples is None:
+            samples = self._load_sample_files(tables, os.path.dirname(excel_file))
+        tables_with_data = [table for table in tables if table in samples]
+        if not tables_with_data:
+            print("No tables with sample data, skipping Word volumes")
+            return []
+        
+        volumes = self._partition_word_volumes(tables_with_data, partition_by, max_tables_per_volume,
+                                               self._default_schema())
+        test_mode = getattr(self, 'test_mode', False)
+        word_base = excel_file.replace('.xlsx', '_specification')
+        
+        jobs = []
+        for i, (label, volume_tables) in enumerate(volumes, 1):
+            volume_set = set(volume_tables)
+            volume_data = [row for row in all_data if row['Table'] in volume_set]
+            volume_samples = {table: samples[table] for table in volume_tables}
+            word_file = f"{word_base}_vol{i:02d}.docx"
+            jobs.append((label, volume_tables, volume_data, volume_samples, include_xml, test_mode, word_file))
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, len(jobs)))
+        print(f"Rendering {len(jobs)} Word volumes with {max_workers} worker processes...")
+        
+        volume_files = []
+        if max_workers == 1:
+            for job in jobs:
+                volume_files.append(_render_word_volume(job))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map keeps results in volume order for the index
+                for word_file in executor.map(_render_word_volume, jobs):
+                    volume_files.append(word_file)
+        
+        for word_file in volume_files:
+            print(f"  Volume saved to: {word_file}")
+        
+        # Master index document linking all volumes
+        index_doc = Document()
+        index_doc.add_heading('Database Schema Specification - Index', 0)
+        index_doc.add_paragraph(f'Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
+        index_doc.add_paragraph(f'Total Tables with Sample Data: {len(tables_with_data)}')
+        index_doc.add_paragraph(f'Volumes: {len(volumes)}')
+        if test_mode:
+            index_doc.add_paragraph('Note: This is a test mode or subset document')
+        index_doc.add_paragraph('')
+        
+        for (label, volume_tables), word_file in zip(volumes, volume_files):
+            doc_name = os.path.basename(word_file)
+            para = index_doc.add_paragraph(style='List Number')
+            self._add_hyperlink(para, doc_name, f'{label} ({len(volume_tables)} tables)')
+            index_doc.add_paragraph(f'{volume_tables[0]} - {volume_tables[-1]}')
+        
+        index_file = f"{word_base}_index.docx"
+        index_doc.save(index_file)
+        print(f"Word specification index saved to: {index_file}")
+        return volume_files
+    
+    def _load_sample_files(self, tables, base_path):
+        """Read the sample files exported next to the Excel file into {table: {'json', 'xml'}}"""
+        samples = {}
+        for table in tables:
+            json_file = os.path.join(base_path, f"{table}_sample.json")
+            if not os.path.exists(json_file):
+                continue
+            with open(json_file, 'r') as f:
+                table_samples = {'json': json.load(f)}
+            xml_file = os.path.join(base_path, f"{table}_sample.xml")
+            if os.path.exists(xml_file):
+                with open(xml_file, 'r') as f:
+                    table_samples['xml'] = f.read()
+            samples[table] = table_samples
+        return samples
+    
+    def _partition_word_volumes(self, tables, partition_by='count', max_tables_per_volume=250,
+                                default_schema='public'):
+        """Split tables into (label, tables) volumes by schema, alphabetical range or count.
+        
+        Bare table names are in default_schema, e.g. 'dbo' on SQL Server.
+        """
+        max_tables_per_volume = max(1, int(max_tables_per_volume))
+        tables = sorted(tables)
+        
+        if partition_by == 'schema':
+            groups = {}
+            for table in tables:
+                schema = table.split('.', 1)[0] if '.' in table else default_schema
+                groups.setdefault(schema, []).append(table)
+            volumes = []
+            for schema, schema_tables in groups.items():
+                chunks = [schema_tables[i:i + max_tables_per_volume]
+                          for i in range(0, len(schema_tables), max_tables_per_volume)]
+                for n, chunk in enumerate(chunks, 1):
+                    label = schema if len(chunks) == 1 else f'{schema} (part {n})'
+                    volumes.append((label, chunk))
+            return volumes
+        
+        if partition_by == 'alpha':
+            # Group by the leading letter of the bare table name, in letter order
+            letters = {}
+            for table in sorted(tables, key=lambda t: (t.split('.', 1)[-1].lower(), t)):
+                name = table.split('.', 1)[-1]
+                key = name[:1].upper() if name[:1].isalpha() else '#'
+                letters.setdefault(key, []).append(table)
+            volumes = []
+            current_keys, current = [], []
+            for key in sorted(letters):
+                letter_tables = letters[key]
+                if current and len(current) + len(letter_tables) > max_tables_per_volume:
+                    volumes.append((self._alpha_label(current_keys), current))
+                    current_keys, current = [], []
+                if len(letter_tables) > max_tables_per_volume:
+                    # One letter can hold most of a warehouse (fact_, stg_), so split it too
+                    chunks = [letter_tables[i:i + max_tables_per_volume]
+                              for i in range(0, len(letter_tables), max_tables_per_volume)]
+                    for n, chunk in enumerate(chunks, 1):
+                        volumes.append((f'{key} (part {n})', chunk))
+                    continue
+                # Merge adjacent letters up to the volume size
+                current_keys.append(key)
+                current.extend(letter_tables)
+            if current:
+                volumes.append((self._alpha_label(current_keys), current))
+            return volumes
+        
+        # Default: fixed number of tables per volume
+        volumes = []
+        for i in range(0, len(tables), max_tables_per_volume):
+            chunk = tables[i:i + max_tables_per_volume]
+            volumes.append((f'Volume {len(volumes) + 1}', chunk))
+        return volumes
+    
+    def _alpha_label(self, keys):
+        return keys[0] if len(keys) == 1 else f'{keys[0]}-{keys[-1]}'
+    
+    def _add_hyperlink(self, paragraph, url, text):
+        """Add an external hyperlink run to a paragraph (python-docx has no API for this)"""
+        from docx.oxml.shared import OxmlElement, qn
+        from docx.opc.constants import RELATIONSHIP_TYPE
+        
+        r_id = paragraph.part.relate_to(url, RELATIONSHIP_TYPE.HYPERLINK, is_external=True)
+        hyperlink = OxmlElement('w:hyperlink')
+        hyperlink.set(qn('r:id'), r_id)
+        
+        run = OxmlElement('w:r')
+        run_props = OxmlElement('w:rPr')
+        color = OxmlElement('w:color')
+        color.set(qn('w:val'), '0563C1')
+        run_props.append(color)
+        underline = OxmlElement('w:u')
+        underline.set(qn('w:val'), 'single')
+        run_props.append(underline)
+        run.append(run_props)
+        run_text = OxmlElement('w:t')
+        run_text.text = text
+        run.append(run_text)
+        
+        hyperlink.append(run)
+        paragraph._p.append(hyperlink)
+        return hyperlink
+    
+    def _build_word_document(self, tables_with_data, all_data, samples, include_xml=False,
+                             test_mode=False, heading='Database Schema Specification'):
         doc = Document()
         
         # Title
-        title = doc.add_heading('Database Schema Specification', 0)
+        title = doc.add_heading(heading, 0)
         
         # Document info
         doc.add_paragraph(f'Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}')
         # Count tables with sample data
-        base_path = os.path.dirname(excel_file)
-        tables_with_data_count = sum(1 for table in tables if os.path.exists(os.path.join(base_path, f"{table}_sample.json")))
-        doc.add_paragraph(f'Total Tables with Sample Data: {tables_with_data_count}')
-        if test_mode == 'y':
+        doc.add_paragraph(f'Total Tables with Sample Data: {len(tables_with_data)}')
+        if test_mode:
             doc.add_paragraph('Note: This is a test mode or subset document')
         doc.add_paragraph('')
         
         # Table of Contents - only show tables with sample data
         doc.add_heading('Table of Contents', level=1)
-        tables_with_data = []
-        base_path = os.path.dirname(excel_file)
-        
-        for table in tables:
-            json_file = os.path.join(base_path, f"{table}_sample.json")
-            if os.path.exists(json_file):
-                tables_with_data.append(table)
-        
         for i, table in enumerate(tables_with_data, 1):
             doc.add_paragraph(f'{i}. {table}', style='List Number')
         doc.add_page_break()
         
+        # Group columns by table once instead of rescanning all_data per table
+        columns_by_table = {}
+        for row in all_data:
+            columns_by_table.setdefault(row['Table'], []).append(row)
+        
         # Table specifications - only include tables with sample data
-        tables_with_data = []
-        base_path = os.path.dirname(excel_file)
+        for table in tables_with_data:
+            self._add_word_table_section(doc, table, columns_by_table.get(table, []), samples.get(table),
+                                         include_xml)
         
-        for table in tables:
-            json_file = os.path.join(base_path, f"{table}_sample.json")
-            if os.path.exists(json_file):
-                tables_with_data.append(table)
+        return doc
+    
+    def _add_word_table_section(self, doc, table, table_data, table_samples, include_xml=False):
+        doc.add_heading(f'Table: {table}', level=1)
         
-        for table in tables_with_data:
-            doc.add_heading(f'Table: {table}', level=1)
+        if table_data:
+            # API URL section
+            doc.add_heading('API URL', level=2)
             
-            # Get table data
-            table_data = [row for row in all_data if row['Table'] == table]
+            # Create API URL table
+            api_table = doc.add_table(rows=1, cols=4)
+            api_table.style = 'Table Grid'
+            api_hdr_cells = api_table.rows[0].cells
             
-            if table_data:
-                # API URL section
-                doc.add_heading('API URL', level=2)
-                
-                # Create API URL table
-                api_table = doc.add_table(rows=1, cols=4)
-                api_table.style = 'Table Grid'
-                api_hdr_cells = api_table.rows[0].cells
-                
-                # Format API header
-                from docx.oxml.shared import qn
-                from docx.oxml import parse_xml
-                
-                # Set API header text first
-                api_hdr_cells[0].text = 'Resource'
-                api_hdr_cells[1].text = 'Base URL'
-                api_hdr_cells[2].text = 'Request Method'
-                api_hdr_cells[3].text = 'Notes'
-                
-                # Then format each cell with black background
-                for cell in api_hdr_cells:
-                    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    for run in cell.paragraphs[0].runs:
-                        run.font.bold = True
-                        run.font.color.rgb = RGBColor(255, 255, 255)  # White text
-                    
-                    # Add black background
-                    shading_elm = parse_xml('<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="000000"/>')
-                    cell._tc.get_or_add_tcPr().append(shading_elm)
-                
-                # Add GET row
-                get_row_cells = api_table.add_row().cells
-                get_row_cells[0].text = table.upper()
-                get_row_cells[1].text = f'BaseURL/API/{{system}}/{table}'
-                get_row_cells[2].text = 'GET'
-                get_row_cells[3].text = ''
-                
-                # Add GET ITEM row
-                get_item_row_cells = api_table.add_row().cells
-                get_item_row_cells[0].text = table.upper()
-                get_item_row_cells[1].text = f'BaseURL/API/{{system}}/{table}/{{guid}}'
-                get_item_row_cells[2].text = 'GET ITEM'
-                get_item_row_cells[3].text = ''
-                
-                doc.add_paragraph('')
-                
-                # Query Parameters section
-                doc.add_heading('Query Parameters', level=2)
-                
-                # Create parameters table
-                param_table = doc.add_table(rows=1, cols=4)
-                param_table.style = 'Table Grid'
-                param_hdr_cells = param_table.rows[0].cells
-                
-                # Set parameter header text
-                param_hdr_cells[0].text = 'Parameter'
-                param_hdr_cells[1].text = 'Type'
-                param_hdr_cells[2].text = 'Required'
-                param_hdr_cells[3].text = 'Description'
-                
-                # Format parameter header
-                for cell in param_hdr_cells:
-                    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    for run in cell.paragraphs[0].runs:
-                        run.font.bold = True
-                        run.font.color.rgb = RGBColor(255, 255, 255)
-                    
-                    shading_elm = parse_xml('<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="4472C4"/>')
-                    cell._tc.get_or_add_tcPr().append(shading_elm)
-                
-                # Add parameter rows
-                params = [
-                    ('filter_by', 'string', 'No', 'WHERE clause condition (e.g., IMPORTEDTIME>\'2024-01-05\')'),
-                    ('limit', 'integer', 'No', 'Maximum number of records to return (e.g., 300)'),
-                    ('offset', 'integer', 'No', 'Number of records to skip for pagination (e.g., 0)'),
-                    ('order_by', 'string', 'No', 'ORDER BY clause for sorting (e.g., IMPORTEDTIME ASC)'),
-                    ('column_names', 'string', 'No', 'Comma-delimited list of column names (e.g., id,name,email)')
-                ]
-                
-                for param_name, param_type, required, description in params:
-                    param_row_cells = param_table.add_row().cells
-                    param_row_cells[0].text = param_name
-                    param_row_cells[1].text = param_type
-                    param_row_cells[2].text = required
-                    param_row_cells[3].text = description
-                
-                doc.add_paragraph('')
-                
-                # Column specifications
-                doc.add_heading('Column Specifications', level=2)
+            # Format API header
+            from docx.oxml.shared import qn
+            from docx.oxml import parse_xml
+            
+            # Set API header text first
+            api_hdr_cells[0].text = 'Resource'
+            api_hdr_cells[1].text = 'Base URL'
+            api_hdr_cells[2].text = 'Request Method'
+            api_hdr_cells[3].text = 'Notes'
+            
+            # Then format each cell with black background
+            for cell in api_hdr_cells:
+                cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+                for run in cell.paragraphs[0].runs:
+                    run.font.bold = True
+                    run.font.color.rgb = RGBColor(255, 255, 255)  # White text
                 
-                # Create table
-                table_doc = doc.add_table(rows=1, cols=5)
-                table_doc.style = 'Table Grid'
-                hdr_cells = table_doc.rows[0].cells
+                # Add black background
+                shading_elm = parse_xml('<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="000000"/>')
+                cell._tc.get_or_add_tcPr().append(shading_elm)
+            
+            # Add GET row
+            get_row_cells = api_table.add_row().cells
+            get_row_cells[0].text = table.upper()
+            get_row_cells[1].text = f'BaseURL/API/{{system}}/{table}'
+            get_row_cells[2].text = 'GET'
+            get_row_cells[3].text = ''
+            
+            # Add GET ITEM row
+            get_item_row_cells = api_table.add_row().cells
+            get_item_row_cells[0].text = table.upper()
+            get_item_row_cells[1].text = f'BaseURL/API/{{system}}/{table}/{{guid}}'
+            get_item_row_cells[2].text = 'GET ITEM'
+            get_item_row_cells[3].text = ''
+            
+            doc.add_paragraph('')
+            
+            # Query Parameters section
+            doc.add_heading('Query Parameters', level=2)
+            
+            # Create parameters table
+            param_table = doc.add_table(rows=1, cols=4)
+            param_table.style = 'Table Grid'
+            param_hdr_cells = param_table.rows[0].cells
+            
+            # Set parameter header text
+            param_hdr_cells[0].text = 'Parameter'
+            param_hdr_cells[1].text = 'Type'
+            param_hdr_cells[2].text = 'Required'
+            param_hdr_cells[3].text = 'Description'
+            
+            # Format parameter header
+            for cell in param_hdr_cells:
+                cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+                for run in cell.paragraphs[0].runs:
+                    run.font.bold = True
+                    run.font.color.rgb = RGBColor(255, 255, 255)
                 
-                # Set header text first
-                hdr_cells[0].text = 'Column Name'
-                hdr_cells[1].text = 'Data Type'
-                hdr_cells[2].text = 'Mandatory'
-                hdr_cells[3].text = 'Description'
-                hdr_cells[4].text = 'Notes / Rules'
+                shading_elm = parse_xml('<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="4472C4"/>')
+                cell._tc.get_or_add_tcPr().append(shading_elm)
+            
+            # Add parameter rows
+            params = [
+                ('filter_by', 'string', 'No', 'WHERE clause condition (e.g., IMPORTEDTIME>\'2024-01-05\')'),
+                ('limit', 'integer', 'No', 'Maximum number of records to return (e.g., 300)'),
+                ('offset', 'integer', 'No', 'Number of records to skip for pagination (e.g., 0)'),
+                ('order_by', 'string', 'No', 'ORDER BY clause for sorting (e.g., IMPORTEDTIME ASC)'),
+                ('column_names', 'string', 'No', 'Comma-delimited list of column names (e.g., id,name,email)')
+            ]
+            
+            for param_name, param_type, required, description in params:
+                param_row_cells = param_table.add_row().cells
+                param_row_cells[0].text = param_name
+                param_row_cells[1].text = param_type
+                param_row_cells[2].text = required
+                param_row_cells[3].text = description
+            
+            doc.add_paragraph('')
+            
+            # Column specifications
+            doc.add_heading('Column Specifications', level=2)
+            
+            # Create table
+            table_doc = doc.add_table(rows=1, cols=5)
+            table_doc.style = 'Table Grid'
+            hdr_cells = table_doc.rows[0].cells
+            
+            # Set header text first
+            hdr_cells[0].text = 'Column Name'
+            hdr_cells[1].text = 'Data Type'
+            hdr_cells[2].text = 'Mandatory'
+            hdr_cells[3].text = 'Description'
+            hdr_cells[4].text = 'Notes / Rules'
+            
+            # Then format each cell
+            for cell in hdr_cells:
+                cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
+                for run in cell.paragraphs[0].runs:
+                    run.font.bold = True
+                    run.font.color.rgb = RGBColor(255, 255, 255)  # White text
                 
-                # Then format each cell
-                for cell in hdr_cells:
-                    cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    for run in cell.paragraphs[0].runs:
-                        run.font.bold = True
-                        run.font.color.rgb = RGBColor(255, 255, 255)  # White text
-                    
-                    # Add blue background
-                    shading_elm = parse_xml('<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="4472C4"/>')
-                    cell._tc.get_or_add_tcPr().append(shading_elm)
+                # Add blue background
+                shading_elm = parse_xml('<w:shd xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" w:fill="4472C4"/>')
+                cell._tc.get_or_add_tcPr().append(shading_elm)
+            
+            for col_info in table_data:
+                row_cells = table_doc.add_row().cells
+                row_cells[0].text = col_info['Column']
+                row_cells[1].text = col_info['Data_Type']
+                row_cells[2].text = col_info['Mandatory']
+                row_cells[3].text = ''
+                row_cells[4].text = ''
+            
+            doc.add_paragraph('')
+            
+            # Sample data section
+            doc.add_heading('Sample Data', level=2)
+            
+            # Include actual JSON and XML sample data
+            if table_samples:
+                doc.add_paragraph('JSON Sample:')
+                json_para = doc.add_paragraph(json.dumps(table_samples['json'], indent=2))
+                json_para.style = 'Intense Quote'
                 
-                for col_info in table_data:
-                    row_cells = table_doc.add_row().cells
-                    row_cells[0].text = col_info['Column']
-                    row_cells[1].text = col_info['Data_Type']
-                    row_cells[2].text = col_info['Mandatory']
-                    row_cells[3].text = ''
-                    row_cells[4].text = ''
+                if include_xml and 'xml' in table_samples:
+                    doc.add_paragraph('XML Sample:')
+                    xml_para = doc.add_paragraph(table_samples['xml'])
+                    xml_para.style = 'Intense Quote'
                 
                 doc.add_paragraph('')
-                
-                # Sample data section
-                doc.add_heading('Sample Data', level=2)
-                
-                # Include actual JSON and XML sample data
-                base_path = os.path.dirname(excel_file)
-                json_file = os.path.join(base_path, f"{table}_sample.json")
-                
-                if os.path.exists(json_file):
-                    with open(json_file, 'r') as f:
-                        sample_data = json.load(f)
-                    
-                    doc.add_paragraph('JSON Sample:')
-                    json_para = doc.add_paragraph(json.dumps(sample_data, indent=2))
-                    json_para.style = 'Intense Quote'
-                    
-                    if include_xml:
-                        xml_file = os.path.join(base_path, f"{table}_sample.xml")
-                        if os.path.exists(xml_file):
-                            with open(xml_file, 'r') as f:
-                                xml_data = f.read()
-                            
-                            doc.add_paragraph('XML Sample:')
-                            xml_para = doc.add_paragraph(xml_data)
-                            xml_para.style = 'Intense Quote'
-                    
-                    doc.add_paragraph('')
-            
-            doc.add_page_break()
         
-        # Save Word document
-        word_file = excel_file.replace('.xlsx', '_specification.docx')
-        doc.save(word_file)
-        print(f"Word specification saved to: {word_file}")
+        doc.add_page_break()
     
     def create_swagger_spec(self, tables, all_data, excel_file, include_xml=False):
         """Generate OpenAPI/Swagger specification for all tables"""
@@ -488,9 +1360,14 @@ class DBToExcel:
             }
         }
         
+        # Group columns by table once instead of rescanning all_data per table
+        columns_by_table = {}
+        for row in all_data:
+            columns_by_table.setdefault(row['Table'], []).append(row)
+        
         # Process each table
         for table in tables:
-            table_data = [row for row in all_data if row['Table'] == table]
+            table_data = columns_by_table.get(table, [])
             if not table_data:
                 continue
             
@@ -524,6 +1401,10 @@ class DBToExcel:
                 # Add example from sample data if available
                 if col_info['Sample_1']:
                     schema_properties[col_name]["example"] = col_info['Sample_1']
+                
+                # Refine constraints and examples from the column profile
+                if col_info.get('Null_Fraction', '') != '':
+                    self._apply_column_profile(schema_properties[col_name], col_info)
             
             # Add schema to components
             swagger_spec["components"]["schemas"][table] = {
@@ -676,7 +1557,9 @@ class DBToExcel:
         swagger_json_file = os.path.join(base_path, "api_documentation.json")
         
         with open(swagger_yaml_file, 'w') as f:
-            yaml.dump(swagger_spec, f, default_flow_style=False, sort_keys=False)
+            # The libyaml-backed dumper is much faster on large specs when PyYAML was built with it
+            yaml.dump(swagger_spec, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+                      default_flow_style=False, sort_keys=False)
         
         with open(swagger_json_file, 'w') as f:
             json.dump(swagger_spec, f, indent=2)
@@ -692,6 +1575,57 @@ class DBToExcel:
         print(f"  2. Or go to https://editor.swagger.io and upload the YAML/JSON file")
         print(f"  3. If HTML doesn't work, use the JSON file - it's more reliable for large specs")
     
+    def _apply_column_profile(self, prop, col_info):
+        """Add nullable, observed bounds, enum and a realistic example to a schema property"""
+        prop["nullable"] = col_info['Mandatory'] != 'Y'
+        null_fraction = float(col_info['Null_Fraction'] or 0)
+        if null_fraction:
+            prop["description"] = f"{prop['description']} ({null_fraction:.1%} null)"
+        
+        if prop["type"] in ('integer', 'number'):
+            for key, profile_key in (("minimum", 'Min_Value'), ("maximum", 'Max_Value')):
+                value = self._coerce_profile_value(col_info.get(profile_key, ''), prop["type"])
+                if value is not None:
+                    prop[key] = value
+        
+        top_values = json.loads(col_info['Top_Values']) if col_info.get('Top_Values') else []
+        top_values = [v for v in (self._coerce_profile_value(v, prop["type"]) for v in top_values) if v is not None]
+        if not top_values:
+            return
+        prop["example"] = top_values[0]
+        if col_info.get('Profile_Scope') != 'full':
+            # Values seen in statistics or a partial scan; not a constraint on the whole table
+            prop["x-observed-values"] = top_values[:PROFILE_TOP_VALUES]
+            return
+        distinct = col_info.get('Distinct_Count', '')
+        if distinct != '' and int(distinct) == len(top_values) and prop["type"] != 'boolean':
+            # OpenAPI 3.0 requires null in the enum for any nullable property to accept null
+            prop["enum"] = top_values + [None] if prop["nullable"] else top_values
+        if len(top_values) > 1:
+            prop["x-top-values"] = top_values[:PROFILE_TOP_VALUES]
+    
+    def _coerce_profile_value(self, value, openapi_type):
+        """Convert a profiled string value to the schema's JSON type, or None if it doesn't fit"""
+        if value is None or value == '':
+            return None
+        try:
+            if openapi_type == 'integer':
+                # int() keeps bigints exact; Decimal handles values written like '5.0' or '1E+3'
+                try:
+                    return int(value)
+                except ValueError:
+                    return int(Decimal(str(value)))
+            if openapi_type == 'number':
+                number = Decimal(str(value))
+                if not number.is_finite():
+                    return None
+                return int(number) if number == number.to_integral_value() else float(number)
+            if openapi_type == 'boolean':
+                return str(value).lower() in ('1', 'true', 't', 'y', 'yes')
+        except (TypeError, ValueError, ArithmeticError):
+            return None
+        return str(value)
+    
     def create_swagger_html(self, swagger_spec, base_path):
         """Generate a standalone HTML file with Swagger UI"""
         # Use compact JSON to reduce file size
@@ -736,6 +1670,326 @@ class DBToExcel:
             print(f"  Warning: Could not create HTML file: {e}")
             print(f"  Use the JSON or YAML files with https://editor.swagger.io instead")
     
+    def run_load_test(self, spec_file=None, rows_per_table=10000, requests_per_endpoint=50,
+                      concurrency=8, seed=42):
+        """Replay request mixes synthesized from a generated OpenAPI document.
+        
+        Each documented table is recreated in a local SQLite stand-in database filled
+        with rows built from the schema examples, enums and bounds. Requests use the
+        documented query parameters and are translated to the SQL the API would run.
+        Reports p50/p95/p99 latency and rows per second per endpoint.
+        """
+        if spec_file is None:
+            root = tk.Tk()
+            root.withdraw()
+            spec_file = filedialog.askopenfilename(
+                filetypes=[("OpenAPI JSON", "*.json"), ("All files", "*.*")],
+                title="Select generated api_documentation.json"
+            )
+            if not spec_file:
+                print("Load test cancelled")
+                return None
+        
+        if requests_per_endpoint < 1:
+            print("Requests per endpoint must be at least 1")
+            return None
+        
+        with open(spec_file, 'r') as f:
+            swagger_spec = json.load(f)
+        
+        endpoints = self._load_test_endpoints(swagger_spec)
+        if not endpoints:
+            print("No GET endpoints with table schemas found in the OpenAPI document")
+            return None
+        
+        base_path = os.path.dirname(spec_file)
+        db_file = os.path.join(base_path, "load_test_standin.sqlite")
+        rng = random.Random(seed)
+        
+        print(f"Building SQLite stand-in with {rows_per_table} rows for {len(endpoints)} tables...")
+        self._build_standin_database(db_file, endpoints, rows_per_table, rng)
+        
+        requests = []
+        for endpoint in endpoints:
+            requests.extend(self._synthesize_requests(endpoint, requests_per_endpoint, rng))
+        rng.shuffle(requests)
+        if not requests:
+            print("No documented table has properties to query, nothing to replay")
+            return None
+        
+        print(f"Replaying {len(requests)} requests with {concurrency} concurrent workers...")
+        local = threading.local()
+        connections = []
+        connections_lock = threading.Lock()
+        
+        def execute(request):
+            conn = getattr(local, 'conn', None)
+            if conn is None:
+                conn = sqlite3.connect(db_file, check_same_thread=False)
+                local.conn = conn
+                with connections_lock:
+                    connections.append(conn)
+            start = time.perf_counter()
+            try:
+                row_count = len(conn.execute(request['sql'], request['params']).fetchall())
+                error = ''
+            except sqlite3.Error as e:
+                row_count = 0
+                error = str(e)
+            return request, time.perf_counter() - start, row_count, error
+        
+        wall_start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            results = list(executor.map(execute, requests))
+        wall_time = time.perf_counter() - wall_start
+        for conn in connections:
+            conn.close()
+        
+        report = self._load_test_report(results)
+        report_file = os.path.join(base_path, "load_test_report.xlsx")
+        report.to_excel(report_file, index=False)
+        
+        print(f"\n{report.to_string(index=False)}")
+        print(f"\n{len(requests)} requests in {wall_time:.2f}s ({len(requests) / wall_time:.1f} requests/s)")
+        print(f"Load test report saved to: {report_file}")
+        return report
+    
+    def _load_test_endpoints(self, swagger_spec):
+        """Collect (path, table, properties, parameters) for every GET endpoint returning a table schema"""
+        schemas = swagger_spec.get('components', {}).get('schemas', {})
+        shared_parameters = swagger_spec.get('components', {}).get('parameters', {})
+        endpoints = []
+        
+        for path, operations in swagger_spec.get('paths', {}).items():
+            get_op = operations.get('get')
+            if not get_op:
+                continue
+            try:
+                response_schema = get_op['responses']['200']['content']['application/json']['schema']
+                ref = response_schema['properties']['data']['items']['$ref']
+            except (KeyError, TypeError):
+                continue
+            table = ref.split('/')[-1]
+            if table not in schemas:
+                continue
+            
+            parameters = {}
+            for param in get_op.get('parameters', []):
+                if '$ref' in param:
+                    param = shared_parameters.get(param['$ref'].split('/')[-1], {})
+                if param.get('in') == 'query':
+                    parameters[param['name']] = param
+            
+            endpoints.append({
+                'path': path,
+                'table': table,
+                'properties': schemas[table].get('properties', {}),
+                'parameters': parameters
+            })
+        return endpoints
+    
+    def _build_standin_database(self, db_file, endpoints, rows_per_table, rng):
+        """Create one SQLite table per documented schema and fill it with synthetic rows"""
+        if os.path.exists(db_file):
+            os.remove(db_file)
+        sqlite_types = {'integer': 'INTEGER', 'number': 'REAL', 'boolean': 'INTEGER'}
+        
+        conn = sqlite3.connect(db_file)
+        try:
+            for endpoint in endpoints:
+                table = endpoint['table']
+                properties = endpoint['properties']
+                if not properties:
+                    continue
+                col_names = list(properties)
+                col_defs = ', '.join(
+                    f"{self._sqlite_quote(name)} {sqlite_types.get(prop.get('type'), 'TEXT')}"
+                    for name, prop in properties.items()
+                )
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {self._sqlite_quote(table)} ({col_defs})")
+                
+                rows = ([self._synthetic_value(properties[name], i, rng) for name in col_names]
+                        for i in range(rows_per_table))
+                placeholders = ', '.join('?' for _ in col_names)
+                conn.executemany(f"INSERT INTO {self._sqlite_quote(table)} VALUES ({placeholders})", rows)
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def _synthetic_value(self, prop, i, rng):
+        """Generate the i-th stand-in value for a schema property from its example, enum and bounds"""
+        if prop.get('enum'):
+            return self._sqlite_value(rng.choice(prop['enum']), prop)
+        
+        prop_type = prop.get('type')
+        example = prop.get('example')
+        if prop_type == 'integer':
+            if 'minimum' in prop and 'maximum' in prop:
+                return rng.randint(int(prop['minimum']), int(prop['maximum']))
+            return i + 1
+        if prop_type == 'number':
+            low = float(prop.get('minimum', 0))
+            high = float(prop.get('maximum', low + 1000))
+            return round(rng.uniform(low, high), 2)
+        if prop_type == 'boolean':
+            return i % 2
+        if prop.get('format') in ('date', 'date-time'):
+            base = pd.to_datetime(example, errors='coerce') if example else pd.NaT
+            if pd.isna(base):
+                base = pd.Timestamp('2024-01-01')
+            value = base + pd.Timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+            return value.strftime('%Y-%m-%d' if prop.get('format') == 'date' else '%Y-%m-%d %H:%M:%S')
+        
+        value = f"{example}_{i}" if example not in (None, '', 'NULL') else f"value_{i}"
+        if 'maxLength' in prop:
+            value = value[-int(prop['maxLength']):]
+        return value
+    
+    def _sqlite_value(self, value, prop):
+        if prop.get('type') == 'boolean':
+            return 1 if value in (True, 1, '1', 'true', 'True') else 0
+        return value
+    
+    def _sqlite_quote(self, identifier):
+        return '"' + str(identifier).replace('"', '""') + '"'
+    
+    def _synthesize_requests(self, endpoint, count, rng):
+        """Build a mix of documented parameter combinations and their equivalent SQL"""
+        properties = endpoint['properties']
+        parameters = endpoint['parameters']
+        col_names = list(properties)
+        if not col_names:
+            return []
+        lower_names = {name.lower(): name for name in col_names}
+        
+        # Limit values: documented example plus the schema bounds
+        limit_values = [100]
+        limit_param = parameters.get('limit')
+        if limit_param:
+            limit_schema = limit_param.get('schema', {})
+            limit_values = [v for v in (limit_param.get('example'), limit_schema.get('minimum'),
+                                        limit_schema.get('maximum')) if v is not None] or limit_values
+        offset_values = [0]
+        if 'offset' in parameters:
+            offset_values = [parameters['offset'].get('example', 0), 1000, 5000]
+        
+        # Filters: the documented example when its column exists, plus one per column
+        filters = [None]
+        if 'filter_by' in parameters:
+            documented = self._documented_filter(parameters['filter_by'].get('example', ''), lower_names)
+            if documented:
+                filters.append(documented)
+            for name, prop in properties.items():
+                synthesized = self._synthesize_filter(name, prop, rng)
+                if synthesized:
+                    filters.append(synthesized)
+        
+        orderings = [None]
+        if 'order_by' in parameters:
+            example_col = str(parameters['order_by'].get('example', '')).split(' ')[0].lower()
+            if example_col in lower_names:
+                orderings.append((lower_names[example_col], 'ASC'))
+            orderings.extend((name, rng.choice(('ASC', 'DESC'))) for name in col_names)
+        
+        projections = [None]
+        if 'column_names' in parameters:
+            example_cols = [lower_names[c.strip().lower()]
+                            for c in str(parameters['column_names'].get('example', '')).split(',')
+                            if c.strip().lower() in lower_names]
+            if example_cols:
+                projections.append(example_cols)
+            projections.append(rng.sample(col_names, max(1, len(col_names) // 3)))
+        
+        table_ref = self._sqlite_quote(endpoint['table'])
+        requests = []
+        for _ in range(count):
+            limit = int(rng.choice(limit_values))
+            offset = int(rng.choice(offset_values))
+            where = rng.choice(filters)
+            order = rng.choice(orderings)
+            columns = rng.choice(projections)
+            
+            select_list = ', '.join(self._sqlite_quote(c) for c in columns) if columns else '*'
+            sql = f"SELECT {select_list} FROM {table_ref}"
+            params = []
+            query = {'limit': limit, 'offset': offset}
+            if where:
+                sql += f" WHERE {self._sqlite_quote(where[0])} {where[1]} ?"
+                params.append(where[2])
+                query['filter_by'] = f"{where[0]}{where[1]}'{where[2]}'"
+            if order:
+                sql += f" ORDER BY {self._sqlite_quote(order[0])} {order[1]}"
+                query['order_by'] = f"{order[0]} {order[1]}"
+            if columns:
+                query['column_names'] = ','.join(columns)
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+            
+            requests.append({'endpoint': endpoint['path'], 'query': query, 'sql': sql, 'params': params})
+        return requests
+    
+    def _documented_filter(self, example, lower_names):
+        """Parse a documented filter_by example like IMPORTEDTIME>'2024-01-05' into (column, op, value)"""
+        import re
+        match = re.match(r"\s*(\w+)\s*(>=|<=|<>|!=|=|>|<)\s*'?([^']*)'?\s*$", str(example))
+        if not match or match.group(1).lower() not in lower_names:
+            return None
+        return lower_names[match.group(1).lower()], match.group(2), match.group(3)
+    
+    def _synthesize_filter(self, name, prop, rng):
+        """A plausible filter_by condition for one column, as (column, op, value)"""
+        # Nullable enums list None, which can't be matched with '='
+        enum_values = [value for value in prop.get('enum', []) if value is not None]
+        if enum_values:
+            return name, '=', self._sqlite_value(rng.choice(enum_values), prop)
+        prop_type = prop.get('type')
+        if prop_type in ('integer', 'number') and 'minimum' in prop and 'maximum' in prop:
+            return name, '>', (float(prop['minimum']) + float(prop['maximum'])) / 2
+        if prop.get('format') in ('date', 'date-time') and prop.get('example'):
+            return name, '>', str(prop['example'])
+        if prop_type == 'string' and prop.get('example') not in (None, '', 'NULL'):
+            return name, '=', f"{prop['example']}_{rng.randint(0, 100)}"
+        return None
+    
+    def _load_test_report(self, results):
+        """Summarize replay results into p50/p95/p99 latency and rows per second per endpoint"""
+        by_endpoint = {}
+        for request, elapsed, row_count, error in results:
+            by_endpoint.setdefault(request['endpoint'], []).append((request, elapsed, row_count, error))
+        
+        report_rows = []
+        for endpoint, endpoint_results in sorted(by_endpoint.items()):
+            latencies = sorted(elapsed for _, elapsed, _, _ in endpoint_results)
+            total_rows = sum(row_count for _, _, row_count, _ in endpoint_results)
+            busy_time = sum(latencies)
+            large_limits = sorted(elapsed for request, elapsed, _, _ in endpoint_results
+                                  if request['query']['limit'] >= 1000)
+            slowest = max(endpoint_results, key=lambda result: result[1])
+            report_rows.append({
+                'Endpoint': endpoint,
+                'Requests': len(endpoint_results),
+                'Errors': sum(1 for _, _, _, error in endpoint_results if error),
+                'p50_ms': round(self._percentile(latencies, 50) * 1000, 2),
+                'p95_ms': round(self._percentile(latencies, 95) * 1000, 2),
+                'p99_ms': round(self._percentile(latencies, 99) * 1000, 2),
+                'Large_Limit_p95_ms': round(self._percentile(large_limits, 95) * 1000, 2) if large_limits else '',
+                'Avg_Rows': round(total_rows / len(endpoint_results), 1),
+                'Rows_per_sec': round(total_rows / busy_time, 1) if busy_time else '',
+                'Slowest_Request': json.dumps(slowest[0]['query'])
+            })
+        
+        if not report_rows:
+            return pd.DataFrame(report_rows)
+        # Slowest endpoints first so tables needing tighter limits stand out
+        return pd.DataFrame(report_rows).sort_values('p95_ms', ascending=False)
+    
+    def _percentile(self, sorted_values, pct):
+        """Nearest-rank percentile of an already sorted list"""
+        if not sorted_values:
+            return 0.0
+        rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+        return sorted_values[rank - 1]
+    
     def _map_db_type_to_openapi(self, db_type):
         """Map database types to OpenAPI types with constraints"""
         import re
@@ -800,9 +2054,33 @@ class DBToExcel:
         return result
 
 
+def _render_word_volume(job):
+    """Worker process entry point: render and save one Word specification volume"""
+    label, volume_tables, volume_data, volume_samples, include_xml, test_mode, word_file = job
+    doc = DBToExcel()._build_word_document(volume_tables, volume_data, volume_samples, include_xml, test_mode,
+                                           heading=f'Database Schema Specification - {label}')
+    doc.save(word_file)
+    return word_file
+
+
 def main():
     connector = DBToExcel()
     
+    mode = input("Mode (export/render/loadtest, press Enter for export): ").lower().strip()
+    if mode == 'render':
+        connector.render_from_snapshot()
+        return
+    if mode == 'loadtest':
+        requests_per_endpoint = input("Requests per endpoint (press Enter for 50): ").strip()
+        while requests_per_endpoint and not (requests_per_endpoint.isdigit() and int(requests_per_endpoint) > 0):
+            requests_per_endpoint = input("Enter a number greater than 0 (press Enter for 50): ").strip()
+        concurrency = input("Concurrent workers (press Enter for 8): ").strip()
+        connector.run_load_test(
+            requests_per_endpoint=int(requests_per_endpoint) if requests_per_endpoint else 50,
+            concurrency=int(concurrency) if concurrency.isdigit() and int(concurrency) > 0 else 8
+        )
+        return
+    
     db_type = input("Database type (redshift/postgresql/mysql/sqlite/sqlserver): ")
     
     if db_type.lower() == 'sqlite':
@@ -816,7 +2094,10 @@ def main():
         success = connector.connect(db_type, host, port, database, username)
     
     if success:
-        connector.export_tables_to_excel()
+        try:
+            connector.export_tables_to_excel()
+        finally:
+            connector.close_session()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file